@@ -12,7 +12,7 @@ router = APIRouter()
 async def test_news():
     """테스트용 뉴스 엔드포인트 (인증 없음)"""
     try:
-        news = NewsService.get_financial_news("finance", 5)
+        news = await NewsService.get_financial_news("finance", 5)
         return {
             "status": "success",
             "total_count": len(news),
@@ -47,7 +47,7 @@ async def test_ai_analysis():
             }
         
         # 뉴스 가져오기
-        news = NewsService.get_financial_news("finance", 3)
+        news = await NewsService.get_financial_news("finance", 3)
         
         # AI 분석 시도
         openai_service = OpenAIService()
@@ -98,11 +98,10 @@ async def get_financial_news(
 ):
     """금융 뉴스 가져오기"""
     try:
-        # 동기 함수 호출 (await 제거)
         if lang.lower() == "kr":
             news = NewsService.get_korean_financial_news(limit)
         else:
-            news = NewsService.get_financial_news(query, limit)
+            news = await NewsService.get_financial_news(query, limit)
         
         # 뉴스 조회 기록 추가 (각 뉴스 기사별로)
         data_service = SupabaseDataService()
@@ -172,7 +171,7 @@ async def get_stock_news(
             }
         else:
             # 기존 방식 (레거시 지원)
-            news = NewsService.get_stock_related_news(symbol, limit)
+            news = await NewsService.get_stock_related_news(symbol, limit)
             
             # 활동 로그
             data_service = SupabaseDataService()
@@ -209,11 +208,11 @@ async def summarize_news(
 ):
     """뉴스 AI 요약 (Supabase 저장)"""
     try:
-        # 뉴스 가져오기 (동기 함수 호출)
+        # 뉴스 가져오기
         if lang.lower() == "kr":
             news = NewsService.get_korean_financial_news(limit)
         else:
-            news = NewsService.get_financial_news(query, limit)
+            news = await NewsService.get_financial_news(query, limit)
         
         if not news:
             raise HTTPException(status_code=404, detail="요약할 뉴스가 없습니다.")
@@ -266,8 +265,8 @@ async def summarize_stock_news(
 ):
     """특정 주식 관련 뉴스 AI 요약 (Supabase 저장)"""
     try:
-        # 해당 주식 뉴스 가져오기 (동기 함수 호출)
-        news = NewsService.get_stock_related_news(symbol, limit)
+        # 해당 주식 뉴스 가져오기
+        news = await NewsService.get_stock_related_news(symbol, limit)
         
         if not news:
             raise HTTPException(status_code=404, detail=f"{symbol} 관련 뉴스가 없습니다.")
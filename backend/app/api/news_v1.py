@@ -16,11 +16,10 @@ async def get_financial_news_v1(
 ):
     """금융 뉴스 가져오기 (v1 호환성)"""
     try:
-        # 동기 함수 호출
         if lang.lower() == "kr":
             news = NewsService.get_korean_financial_news(limit)
         else:
-            news = NewsService.get_financial_news(query, limit)
+            news = await NewsService.get_financial_news(query, limit)
         
         return {
             "query": query,
@@ -41,7 +40,7 @@ async def get_stock_news_v1(
     """특정 주식 관련 뉴스 (v1 호환성)"""
     try:
         # 기존 방식으로 뉴스 가져오기
-        news = NewsService.get_stock_related_news(symbol, limit)
+        news = await NewsService.get_stock_related_news(symbol, limit)
         
         return {
             "symbol": symbol,
@@ -61,7 +60,7 @@ async def crawl_stock_news_v1(
     """특정 주식 뉴스 크롤링 (v1 호환성)"""
     try:
         # 뉴스 크롤링 시뮬레이션 (실제로는 기존 뉴스 반환)
-        news = NewsService.get_stock_related_news(symbol, limit)
+        news = await NewsService.get_stock_related_news(symbol, limit)
         
         return {
             "symbol": symbol,
@@ -83,7 +82,7 @@ async def analyze_stock_with_news_v1(
     """뉴스 기반 주식 분석 (v1 호환성)"""
     try:
         # 뉴스 가져오기
-        news = NewsService.get_stock_related_news(symbol, news_limit)
+        news = await NewsService.get_stock_related_news(symbol, news_limit)
         
         if not news:
             raise HTTPException(status_code=404, detail=f"{symbol} 관련 뉴스가 없습니다.")
@@ -116,7 +115,7 @@ async def summarize_news_v1(
         if lang.lower() == "kr":
             news = NewsService.get_korean_financial_news(limit)
         else:
-            news = NewsService.get_financial_news(query, limit)
+            news = await NewsService.get_financial_news(query, limit)
         
         if not news:
             raise HTTPException(status_code=404, detail="요약할 뉴스가 없습니다.")
@@ -145,7 +144,7 @@ async def summarize_stock_news_v1(
     """특정 주식 관련 뉴스 AI 요약 (v1 호환성)"""
     try:
         # 해당 주식 뉴스 가져오기
-        news = NewsService.get_stock_related_news(symbol, limit)
+        news = await NewsService.get_stock_related_news(symbol, limit)
         
         if not news:
             raise HTTPException(status_code=404, detail=f"{symbol} 관련 뉴스가 없습니다.")
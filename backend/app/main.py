@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.services.news_service import NewsService
 from app.api import stocks
 from app.api import auth_supabase, analysis_supabase, news_supabase, recommendations_supabase, news_v1, analysis_v1
 
@@ -37,6 +38,10 @@ app.include_router(analysis_supabase.router, prefix="/api/v2/analysis", tags=["a
 app.include_router(news_supabase.router, prefix="/api/v2/news", tags=["news"])
 app.include_router(recommendations_supabase.router, prefix="/api/v2/recommendations", tags=["recommendations"])
 
+@app.on_event("shutdown")
+async def close_http_sessions():
+    await NewsService.close_session()
+
 @app.get("/")
 async def root():
     return {"message": "AI Finance News Recommendation System", "version": "2.0.0"}
@@ -89,6 +89,9 @@ class AINewsRecommendationService:
         """관심사별 뉴스 수집 및 AI 분석"""
         try:
             all_news = []
+            
+            # 중복 관심사는 한 번만 수집 (순서 유지)
+            user_interests = list(dict.fromkeys(user_interests))
             per_interest_limit = max(5, total_limit // len(user_interests))
             
             logger.info(f"관심사 {len(user_interests)}개에 대해 각각 {per_interest_limit}개씩 뉴스 수집 시작")
@@ -112,13 +115,12 @@ class AINewsRecommendationService:
                     all_news.extend(result)
             
             # 중복 제거 (URL 기준)
-            unique_news = []
-            seen_urls = set()
+            news_by_url = {}
             for article in all_news:
-                url = article.get('url', '')
-                if url and url not in seen_urls:
-                    unique_news.append(article)
-                    seen_urls.add(url)
+                url = article.get('url')
+                if url:
+                    news_by_url.setdefault(url, article)
+            unique_news = list(news_by_url.values())
             
             logger.info(f"총 {len(unique_news)}개의 고유한 뉴스 수집 완료")
             return unique_news[:total_limit]
@@ -158,12 +160,11 @@ class AINewsRecommendationService:
         self, 
         user_id: str, 
         news_articles: List[Dict], 
-        user_interests: List[str]
+        user_interests: List[str],
+        max_concurrency: int = 5
     ) -> List[Dict]:
         """AI 기반 개인화 점수 계산"""
         try:
-            scored_articles = []
-            
             # 사용자 컨텍스트 생성 (향후 확장 가능)
             user_context = {
                 "experience_level": "intermediate",  # 추후 프로필에서 가져올 수 있음
@@ -171,13 +172,16 @@ class AINewsRecommendationService:
                 "primary_interests": user_interests[:3]  # 상위 3개 관심사
             }
             
-            # 각 뉴스에 대해 AI 분석 수행
-            for article in news_articles:
+            # 각 뉴스에 대해 AI 분석 수행 (동시 요청 개수 제한)
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def score_article(article: Dict) -> Dict:
                 try:
                     # AI 관련성 분석
-                    ai_analysis = await self.azure_openai.analyze_news_relevance(
-                        article, user_interests, user_context
-                    )
+                    async with semaphore:
+                        ai_analysis = await self.azure_openai.analyze_news_relevance(
+                            article, user_interests, user_context
+                        )
                     
                     # 기본 점수 계산
                     base_score = self._calculate_base_score(article, user_interests)
@@ -196,14 +200,17 @@ class AINewsRecommendationService:
                         'impact_level': ai_analysis.get('impact_level', 'medium')
                     })
                     
-                    scored_articles.append(article)
-                    
                 except Exception as article_error:
                     logger.warning(f"개별 뉴스 분석 실패: {str(article_error)}")
                     # 실패한 경우 기본 점수만 사용
                     article['ai_score'] = self._calculate_base_score(article, user_interests)
                     article['recommendation_reason'] = "기본 관련성 분석"
-                    scored_articles.append(article)
+                
+                return article
+            
+            scored_articles = await asyncio.gather(
+                *(score_article(article) for article in news_articles)
+            )
             
             return scored_articles
             
@@ -327,7 +334,8 @@ class AINewsRecommendationService:
         try:
             sentiment_results = {}
             
-            for symbol in symbols:
+            # 같은 종목이 여러 번 요청되어도 조회/분석은 한 번만 수행
+            for symbol in dict.fromkeys(symbols):
                 # 해당 종목 뉴스 수집
                 news = await NewsDBService.get_news_for_analysis(
                     symbol, days=days_back, limit=20
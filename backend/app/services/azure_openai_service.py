@@ -1,5 +1,6 @@
 import os
 import json
+import asyncio
 import logging
 from typing import List, Dict, Optional
 from openai import AzureOpenAI
@@ -50,7 +51,9 @@ class AzureOpenAIService:
             # 프롬프트 구성
             prompt = self._build_relevance_prompt(news_article, user_interests, user_context)
             
-            response = self.client.chat.completions.create(
+            # 동기 클라이언트 호출이 이벤트 루프를 막지 않도록 스레드에서 실행
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=settings.azure_openai_deployment,
                 messages=[
                     {"role": "system", "content": "You are a financial news analyst specializing in personalized content recommendation."},
@@ -1,8 +1,8 @@
 import asyncio
 import logging
 from typing import List, Dict, Set
+from collections import Counter
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor
 
 from app.services.azure_openai_service import AzureOpenAIService
 from app.services.news_service import NewsService
@@ -12,15 +12,35 @@ from app.db.supabase_client import get_supabase
 
 logger = logging.getLogger(__name__)
 
+# 관심사 데이터가 없을 때 사용하는 기본 인기 종목
+DEFAULT_POPULAR_SYMBOLS = ("AAPL", "GOOGL", "MSFT", "NVDA", "TSLA", "AMZN", "META")
+
+# 종목별 회사명/제품 키워드
+COMPANY_KEYWORDS = {
+    'AAPL': ('apple', 'iphone', 'ipad', 'mac'),
+    'GOOGL': ('google', 'alphabet', 'youtube', 'android'),
+    'MSFT': ('microsoft', 'windows', 'office', 'azure'),
+    'NVDA': ('nvidia', 'gpu', 'graphics'),
+    'TSLA': ('tesla', 'elon', 'electric vehicle', 'ev'),
+    'AMZN': ('amazon', 'aws', 'prime'),
+    'META': ('meta', 'facebook', 'instagram', 'whatsapp')
+}
+
+# 금융/주식 관련 키워드
+FINANCE_KEYWORDS = ('stock', 'shares', 'market', 'trading', 'investor', 'earnings', 'revenue', 'profit')
+
+# 소스 신뢰도 분류
+HIGH_CREDIBILITY_SOURCES = ('reuters', 'bloomberg', 'wall street journal', 'financial times', 'cnbc', 'marketwatch', 'yahoo finance')
+MEDIUM_CREDIBILITY_SOURCES = ('cnn business', 'bbc', 'forbes', 'business insider', 'investing.com', 'yahoo entertainment')
+
 class BackgroundNewsCollector:
     """백그라운드 뉴스 수집 및 AI 분석 서비스"""
     
     def __init__(self):
         self.azure_openai = AzureOpenAIService()
         self.interest_service = SupabaseUserInterestService()
-        self.executor = ThreadPoolExecutor(max_workers=3)
         
-    async def collect_popular_symbols_news(self, limit_per_symbol: int = 20) -> Dict:
+    async def collect_popular_symbols_news(self, limit_per_symbol: int = 20, max_concurrency: int = 4) -> Dict:
         """인기 종목들의 뉴스를 백그라운드에서 수집"""
         try:
             logger.info("백그라운드 뉴스 수집 시작")
@@ -29,15 +49,18 @@ class BackgroundNewsCollector:
             popular_symbols = await self._get_popular_symbols()
             
             if not popular_symbols:
-                popular_symbols = ["AAPL", "GOOGL", "MSFT", "NVDA", "TSLA", "AMZN", "META"]  # 기본 인기 종목
+                popular_symbols = list(DEFAULT_POPULAR_SYMBOLS)  # 기본 인기 종목
             
             logger.info(f"수집 대상 종목: {popular_symbols}")
             
-            # 2. 각 종목별로 뉴스 수집 (병렬 처리)
-            collection_tasks = []
-            for symbol in popular_symbols:
-                task = self._collect_and_analyze_symbol_news(symbol, limit_per_symbol)
-                collection_tasks.append(task)
+            # 2. 각 종목별로 뉴스 수집 (동시 실행 개수를 제한한 병렬 처리)
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def collect_with_limit(symbol: str) -> Dict:
+                async with semaphore:
+                    return await self._collect_and_analyze_symbol_news(symbol, limit_per_symbol)
+            
+            collection_tasks = [collect_with_limit(symbol) for symbol in popular_symbols]
             
             # 병렬 실행
             results = await asyncio.gather(*collection_tasks, return_exceptions=True)
@@ -50,7 +73,7 @@ class BackgroundNewsCollector:
             for i, result in enumerate(results):
                 symbol = popular_symbols[i]
                 if isinstance(result, Exception):
-                    logger.error(f"종목 {symbol} 뉴스 수집 실패: {str(result)}")
+                    logger.error("종목 %s 뉴스 수집 실패: %s", symbol, result)
                     failed_symbols.append(symbol)
                 else:
                     collected_count = result.get('collected_count', 0)
@@ -92,15 +115,12 @@ class BackgroundNewsCollector:
                 return []
             
             # 종목별 등장 횟수 계산
-            symbol_counts = {}
-            for item in result.data:
-                symbol = item.get('interest', '')
-                if symbol:
-                    symbol_counts[symbol] = symbol_counts.get(symbol, 0) + 1
+            symbol_counts = Counter(item.get('interest') for item in result.data)
+            symbol_counts.pop('', None)
+            symbol_counts.pop(None, None)
             
             # 상위 15개 종목 선택
-            popular_symbols = sorted(symbol_counts.items(), key=lambda x: x[1], reverse=True)[:15]
-            return [symbol for symbol, count in popular_symbols]
+            return [symbol for symbol, count in symbol_counts.most_common(15)]
             
         except Exception as e:
             logger.error(f"인기 종목 추출 중 오류: {str(e)}")
@@ -109,7 +129,7 @@ class BackgroundNewsCollector:
     async def _collect_and_analyze_symbol_news(self, symbol: str, limit: int) -> Dict:
         """특정 종목의 뉴스를 수집하고 AI 분석"""
         try:
-            logger.info(f"종목 {symbol} 뉴스 수집 시작")
+            logger.debug("종목 %s 뉴스 수집 시작", symbol)
             
             # 1. 뉴스 크롤링
             news_articles = await NewsService.crawl_and_save_stock_news(symbol, limit)
@@ -123,7 +143,7 @@ class BackgroundNewsCollector:
             # 3. 분석 결과를 DB에 저장 (적합 점수 포함)
             await self._save_analyzed_articles(analyzed_articles)
             
-            logger.info(f"종목 {symbol}: {len(news_articles)}개 수집, {len(analyzed_articles)}개 분석 완료")
+            logger.info("종목 %s: %d개 수집, %d개 분석 완료", symbol, len(news_articles), len(analyzed_articles))
             
             return {
                 "symbol": symbol,
@@ -132,16 +152,22 @@ class BackgroundNewsCollector:
             }
             
         except Exception as e:
-            logger.error(f"종목 {symbol} 뉴스 수집/분석 오류: {str(e)}")
+            logger.error("종목 %s 뉴스 수집/분석 오류: %s", symbol, e)
             raise e
     
-    async def _analyze_articles_relevance(self, articles: List[Dict], symbol: str) -> List[Dict]:
+    async def _analyze_articles_relevance(
+        self, 
+        articles: List[Dict], 
+        symbol: str, 
+        max_concurrency: int = 5
+    ) -> List[Dict]:
         """뉴스 기사들의 일반적 적합성 분석 (Azure OpenAI 사용)"""
         try:
-            analyzed_articles = []
+            analyzed_at = datetime.now().isoformat()
+            semaphore = asyncio.Semaphore(max_concurrency)
             
-            # 각 기사에 대해 기본 적합성 점수 계산
-            for article in articles:
+            # 각 기사에 대해 기본 적합성 점수 계산 (동시 요청 개수 제한)
+            async def analyze_article(article: Dict) -> Dict:
                 try:
                     # 1. 기본 점수 계산
                     base_score = self._calculate_base_relevance_score(article, symbol)
@@ -150,9 +176,10 @@ class BackgroundNewsCollector:
                     ai_score = 0.5  # 기본값
                     try:
                         # 간단한 AI 관련성 분석 (사용자별이 아닌 일반적)
-                        ai_analysis = await self.azure_openai.analyze_news_relevance(
-                            article, [symbol], {"experience_level": "general"}
-                        )
+                        async with semaphore:
+                            ai_analysis = await self.azure_openai.analyze_news_relevance(
+                                article, [symbol], {"experience_level": "general"}
+                            )
                         ai_score = ai_analysis.get('relevance_score', 0.5)
                     except:
                         pass  # AI 분석 실패 시 기본 점수 사용
@@ -164,17 +191,20 @@ class BackgroundNewsCollector:
                     article['relevance_score'] = final_relevance_score
                     article['base_score'] = base_score
                     article['ai_score'] = ai_score
-                    article['analyzed_at'] = datetime.now().isoformat()
-                    
-                    analyzed_articles.append(article)
+                    article['analyzed_at'] = analyzed_at
                     
                 except Exception as article_error:
-                    logger.warning(f"기사 분석 실패: {str(article_error)}")
+                    logger.warning("기사 분석 실패: %s", article_error)
                     # 실패한 경우 기본 점수만 사용
                     article['relevance_score'] = 0.5
                     article['base_score'] = 0.5
                     article['ai_score'] = 0.5
-                    analyzed_articles.append(article)
+                
+                return article
+            
+            analyzed_articles = await asyncio.gather(
+                *(analyze_article(article) for article in articles)
+            )
             
             return analyzed_articles
             
@@ -201,17 +231,7 @@ class BackgroundNewsCollector:
                 score += 0.15
             
             # 회사명 매치 확인
-            company_names = {
-                'AAPL': ['apple', 'iphone', 'ipad', 'mac'],
-                'GOOGL': ['google', 'alphabet', 'youtube', 'android'],
-                'MSFT': ['microsoft', 'windows', 'office', 'azure'],
-                'NVDA': ['nvidia', 'gpu', 'graphics'],
-                'TSLA': ['tesla', 'elon', 'electric vehicle', 'ev'],
-                'AMZN': ['amazon', 'aws', 'prime'],
-                'META': ['meta', 'facebook', 'instagram', 'whatsapp']
-            }
-            
-            company_keywords = company_names.get(symbol.upper(), [])
+            company_keywords = COMPANY_KEYWORDS.get(symbol.upper(), ())
             for keyword in company_keywords:
                 if keyword in title:
                     score += 0.15
@@ -229,9 +249,8 @@ class BackgroundNewsCollector:
             score += source_credibility * 0.2
             
             # 4. 금융/주식 관련 키워드 (25%)
-            finance_keywords = ['stock', 'shares', 'market', 'trading', 'investor', 'earnings', 'revenue', 'profit']
             finance_score = 0.0
-            for keyword in finance_keywords:
+            for keyword in FINANCE_KEYWORDS:
                 if keyword in title or keyword in description:
                     finance_score += 0.1
                     if finance_score >= 0.25:
@@ -241,7 +260,7 @@ class BackgroundNewsCollector:
             return min(1.0, max(0.0, score))
             
         except Exception as e:
-            logger.warning(f"기본 점수 계산 오류: {str(e)}")
+            logger.warning("기본 점수 계산 오류: %s", e)
             return 0.5
     
     def _calculate_freshness_score(self, published_at: str) -> float:
@@ -271,7 +290,7 @@ class BackgroundNewsCollector:
                 return 0.2      # 3일 이후: 낮은점수
                 
         except Exception as e:
-            logger.warning(f"신선도 점수 계산 오류: {str(e)}")
+            logger.warning("신선도 점수 계산 오류: %s", e)
             return 0.3
     
     def _calculate_source_score(self, source: str) -> float:
@@ -282,40 +301,46 @@ class BackgroundNewsCollector:
         source_lower = source.lower()
         
         # 높은 신뢰도 소스
-        high_credibility = ['reuters', 'bloomberg', 'wall street journal', 'financial times', 'cnbc', 'marketwatch', 'yahoo finance']
-        if any(hc in source_lower for hc in high_credibility):
+        if any(hc in source_lower for hc in HIGH_CREDIBILITY_SOURCES):
             return 1.0
         
         # 중간 신뢰도 소스
-        medium_credibility = ['cnn business', 'bbc', 'forbes', 'business insider', 'investing.com', 'yahoo entertainment']
-        if any(mc in source_lower for mc in medium_credibility):
+        if any(mc in source_lower for mc in MEDIUM_CREDIBILITY_SOURCES):
             return 0.7
         
         return 0.5  # 기본값
     
-    async def _save_analyzed_articles(self, analyzed_articles: List[Dict]):
+    async def _save_analyzed_articles(self, analyzed_articles: List[Dict], max_concurrency: int = 5):
         """분석된 기사들을 DB에 저장 (적합 점수 포함)"""
         try:
             supabase = get_supabase()
+            updated_at = datetime.now().isoformat()
+            semaphore = asyncio.Semaphore(max_concurrency)
             
-            for article in analyzed_articles:
-                # 기존 기사 업데이트 (적합 점수 추가)
-                update_data = {
+            # 기존 기사에 적합 점수만 추가 (다른 컬럼은 크롤링 시 저장된 값 유지)
+            def update_scores(article: Dict):
+                return supabase.table("news_articles").update({
                     "relevance_score": article.get('relevance_score', 0.5),
                     "base_score": article.get('base_score', 0.5),
                     "ai_score": article.get('ai_score', 0.5),
                     "analyzed_at": article.get('analyzed_at'),
-                    "updated_at": datetime.now().isoformat()
-                }
-                
-                # URL로 찾아서 업데이트
-                result = supabase.table("news_articles")\
-                    .update(update_data)\
-                    .eq("url", article["url"])\
-                    .execute()
-                
-                if not result.data:
-                    logger.warning(f"기사 업데이트 실패: {article.get('url')}")
+                    "updated_at": updated_at
+                }).eq("url", article["url"]).execute()
+            
+            # 동기 Supabase 호출을 스레드에서 실행 (동시 요청 개수 제한)
+            async def update_article(article: Dict) -> bool:
+                async with semaphore:
+                    result = await asyncio.to_thread(update_scores, article)
+                return bool(result.data)
+            
+            results = await asyncio.gather(
+                *(update_article(article) for article in analyzed_articles if article.get("url")),
+                return_exceptions=True
+            )
+            
+            updated_count = sum(1 for result in results if result is True)
+            if updated_count < len(results):
+                logger.warning(f"기사 업데이트 일부 실패: {updated_count}/{len(results)}개 반영")
             
         except Exception as e:
             logger.error(f"분석된 기사 저장 오류: {str(e)}")
@@ -331,6 +356,9 @@ class BackgroundNewsCollector:
                 .lt("published_at", cutoff_date)\
                 .execute()
             
+            # 삭제된 기사가 다시 수집되면 저장되도록 URL 중복 캐시 초기화
+            NewsDBService.clear_known_urls()
+            
             deleted_count = len(result.data) if result.data else 0
             logger.info(f"오래된 뉴스 {deleted_count}개 정리 완료")
             
@@ -132,14 +132,12 @@ class FastRecommendationService:
                     continue
             
             # 중복 제거 (URL 기준)
-            unique_news = []
-            seen_urls = set()
-            
+            news_by_url = {}
             for article in all_news:
-                url = article.get('url', '')
-                if url and url not in seen_urls:
-                    unique_news.append(article)
-                    seen_urls.add(url)
+                url = article.get('url')
+                if url:
+                    news_by_url.setdefault(url, article)
+            unique_news = list(news_by_url.values())
             
             # 적합 점수 순으로 정렬
             unique_news.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
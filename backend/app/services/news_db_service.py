@@ -1,49 +1,102 @@
-from typing import List, Dict, Optional
-from datetime import datetime
+from collections import OrderedDict
+from typing import Iterable, List, Dict, Optional
+from datetime import datetime, timedelta
 import logging
 from app.db.supabase_client import get_supabase
 
 logger = logging.getLogger(__name__)
 
+# DB에 있는 것으로 확인된 URL을 기억할 최대 개수 (LRU)
+KNOWN_URL_CACHE_SIZE = 100_000
+
+# URL 존재 여부를 한 번에 조회할 최대 개수
+URL_LOOKUP_BATCH_SIZE = 100
+
 class NewsDBService:
     """뉴스 데이터베이스 관련 서비스"""
     
+    # 이미 저장된 것으로 확인된 URL (호출 간 중복 조회 생략용)
+    _known_urls: "OrderedDict[str, None]" = OrderedDict()
+    
+    @staticmethod
+    def _remember_urls(urls: Iterable[str]) -> None:
+        """저장 확인된 URL 기록 (오래된 것부터 제거)"""
+        known_urls = NewsDBService._known_urls
+        for url in urls:
+            known_urls[url] = None
+            known_urls.move_to_end(url)
+        while len(known_urls) > KNOWN_URL_CACHE_SIZE:
+            known_urls.popitem(last=False)
+    
+    @staticmethod
+    def clear_known_urls() -> None:
+        """기억한 URL 초기화 (기사를 삭제한 뒤 다시 저장될 수 있도록)"""
+        NewsDBService._known_urls.clear()
+    
+    @staticmethod
+    def _article_row(article: Dict) -> Dict:
+        """크롤링한 기사를 news_articles 테이블 행으로 변환"""
+        return {
+            "symbol": article.get("symbol"),
+            "title": article.get("title", ""),
+            "description": article.get("description", ""),
+            "content": article.get("content", ""),
+            "url": article["url"],
+            "source": article.get("source", ""),
+            "author": article.get("author", ""),
+            "published_at": article.get("published_at"),
+            "image_url": article.get("image_url", ""),
+            "language": article.get("language", "en"),
+            "category": article.get("category", "finance"),
+            "api_source": article.get("api_source", "unknown")
+        }
+    
     @staticmethod
     async def save_news_articles(articles: List[Dict]) -> List[int]:
         """뉴스 기사들을 데이터베이스에 저장 (중복 체크 포함)"""
         try:
             supabase = get_supabase()
-            saved_ids = []
             
+            # 배치 내 중복과 이전 호출에서 확인된 URL 제외
+            candidates = {}
             for article in articles:
-                # URL 중복 체크
-                existing = supabase.table("news_articles").select("id").eq("url", article["url"]).execute()
-                
-                if existing.data:
-                    logger.info(f"이미 존재하는 뉴스: {article['url']}")
-                    continue
-                
-                # 새 뉴스 저장
-                news_data = {
-                    "symbol": article.get("symbol"),
-                    "title": article.get("title", ""),
-                    "description": article.get("description", ""),
-                    "content": article.get("content", ""),
-                    "url": article["url"],
-                    "source": article.get("source", ""),
-                    "author": article.get("author", ""),
-                    "published_at": article.get("published_at"),
-                    "image_url": article.get("image_url", ""),
-                    "language": article.get("language", "en"),
-                    "category": article.get("category", "finance"),
-                    "api_source": article.get("api_source", "unknown")
-                }
-                
-                result = supabase.table("news_articles").insert(news_data).execute()
-                
-                if result.data:
-                    saved_ids.append(result.data[0]["id"])
-                    logger.info(f"뉴스 저장 완료: {article['title']}")
+                url = article["url"]
+                if url not in NewsDBService._known_urls:
+                    candidates.setdefault(url, article)
+            
+            if not candidates:
+                return []
+            
+            # 이미 저장된 URL을 한 번에 조회 (요청 URL 길이 제한 때문에 묶음 단위)
+            candidate_urls = list(candidates)
+            existing_urls = set()
+            for i in range(0, len(candidate_urls), URL_LOOKUP_BATCH_SIZE):
+                existing = supabase.table("news_articles").select("url")\
+                    .in_("url", candidate_urls[i:i + URL_LOOKUP_BATCH_SIZE])\
+                    .execute()
+                existing_urls.update(row["url"] for row in existing.data or [])
+            
+            if existing_urls:
+                logger.info(f"이미 존재하는 뉴스 {len(existing_urls)}개 제외")
+                NewsDBService._remember_urls(existing_urls)
+            
+            # 새 뉴스 행 준비
+            rows = [
+                NewsDBService._article_row(article)
+                for url, article in candidates.items()
+                if url not in existing_urls
+            ]
+            
+            if not rows:
+                return []
+            
+            # 새 뉴스 일괄 저장 (한 번의 요청, 그 사이 다른 인스턴스가 저장한 URL은 건너뜀)
+            result = supabase.table("news_articles")\
+                .upsert(rows, on_conflict="url", ignore_duplicates=True)\
+                .execute()
+            saved_ids = [row["id"] for row in result.data or []]
+            NewsDBService._remember_urls(row["url"] for row in rows)
+            logger.info(f"뉴스 {len(saved_ids)}개 저장 완료")
             
             return saved_ids
             
@@ -109,7 +162,6 @@ class NewsDBService:
             supabase = get_supabase()
             
             # 최근 N일간의 날짜 계산 (Python에서)
-            from datetime import datetime, timedelta
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
             
             # 최근 N일간의 뉴스 가져오기